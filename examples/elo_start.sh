@@ -1,13 +1,15 @@
 #!/bin/bash
 # Example startup script for macOS/Linux
-# This script receives an absolute file path as the first argument
+# This script receives the absolute paths of both matchup files as arguments
 # Customize this script to control how files are opened
 
 # Default: use the system's default application
 if [[ "$OSTYPE" == "darwin"* ]]; then
-    # macOS
-    open "$1"
+    # macOS: open accepts several paths at once
+    open "$@"
 else
-    # Linux
-    xdg-open "$1"
+    # Linux: xdg-open only takes one path, so open each in turn
+    for file in "$@"; do
+        xdg-open "$file"
+    done
 fi
@@ -29,5 +29,8 @@ else
     exit 1
 fi
 
-# Call the QuickTime AppleScript with the file path
-osascript "$APPLESCRIPT_PATH" "$1"
+# Call the QuickTime AppleScript once per file (both matchup files are
+# passed in a single invocation of this script)
+for file in "$@"; do
+    osascript "$APPLESCRIPT_PATH" "$file"
+done
@@ -1,5 +1,6 @@
 """ANSI color utilities for terminal output."""
 
+import bisect
 import sys
 import os
 
@@ -41,87 +42,82 @@ class Fg:
     BRIGHT_GREEN = '\033[92m'
 
 
-def _apply(code: str, text: str) -> str:
-    """Apply ANSI code to text if colors are enabled."""
-    if not COLORS_ENABLED:
-        return text
-    return f"{code}{text}{Style.RESET}"
+# Prefix/reset strings resolved once at import time; when colors are off
+# they collapse to empty strings, so every helper below is branch-free
+# concatenation instead of an f-string plus an enabled check per call
+_RESET = Style.RESET if COLORS_ENABLED else ''
+_GREEN = Fg.GREEN if COLORS_ENABLED else ''
+_RED = Fg.RED if COLORS_ENABLED else ''
+_YELLOW = Fg.YELLOW if COLORS_ENABLED else ''
+_CYAN = Fg.CYAN if COLORS_ENABLED else ''
+_BLUE = Fg.BLUE if COLORS_ENABLED else ''
+_BRIGHT_GREEN = Fg.BRIGHT_GREEN if COLORS_ENABLED else ''
+_DIM = Style.DIM if COLORS_ENABLED else ''
+_BOLD = Style.BOLD if COLORS_ENABLED else ''
+_BOLD_RED = Style.BOLD + Fg.RED if COLORS_ENABLED else ''
+_BOLD_GREEN = Style.BOLD + Fg.GREEN if COLORS_ENABLED else ''
+_BOLD_CYAN = Style.BOLD + Fg.CYAN if COLORS_ENABLED else ''
 
 
 def green(text: str) -> str:
     """Green text - for positive changes, wins, success."""
-    return _apply(Fg.GREEN, text)
+    return _GREEN + text + _RESET
 
 
 def red(text: str) -> str:
     """Red text - for negative changes, losses, errors."""
-    return _apply(Fg.RED, text)
+    return _RED + text + _RESET
 
 
 def yellow(text: str) -> str:
     """Yellow text - for warnings, neutral info."""
-    return _apply(Fg.YELLOW, text)
+    return _YELLOW + text + _RESET
 
 
 def cyan(text: str) -> str:
     """Cyan text - for headers, titles, emphasis."""
-    return _apply(Fg.CYAN, text)
+    return _CYAN + text + _RESET
 
 
 def dim(text: str) -> str:
     """Dimmed text - for secondary info, no change."""
-    return _apply(Style.DIM, text)
+    return _DIM + text + _RESET
 
 
 def bold(text: str) -> str:
     """Bold text - for emphasis, important info."""
-    return _apply(Style.BOLD, text)
+    return _BOLD + text + _RESET
 
 
 def bold_red(text: str) -> str:
     """Bold red - for dramatic eliminations, critical errors."""
-    if not COLORS_ENABLED:
-        return text
-    return f"{Style.BOLD}{Fg.RED}{text}{Style.RESET}"
+    return _BOLD_RED + text + _RESET
 
 
 def bold_green(text: str) -> str:
     """Bold green - for wins, victories."""
-    if not COLORS_ENABLED:
-        return text
-    return f"{Style.BOLD}{Fg.GREEN}{text}{Style.RESET}"
+    return _BOLD_GREEN + text + _RESET
 
 
 def bold_cyan(text: str) -> str:
     """Bold cyan - for headers."""
-    if not COLORS_ENABLED:
-        return text
-    return f"{Style.BOLD}{Fg.CYAN}{text}{Style.RESET}"
+    return _BOLD_CYAN + text + _RESET
+
+
+# Threshold tables replace the if/elif ladders below with one bisect per
+# call; prefix i applies when the value falls below _*_THRESHOLDS[i], the
+# last prefix when it clears them all
+_PROB_THRESHOLDS = (0.55, 0.7)
+_PROB_PREFIXES = (_DIM, _YELLOW, _GREEN)
+_HIST_THRESHOLDS = (0.3, 0.5, 0.7, 0.9)
+_HIST_PREFIXES = (_DIM, _BLUE, _CYAN, _GREEN, _BRIGHT_GREEN)
 
 
 def prob_color(prob: float, text: str) -> str:
     """Color based on win probability (0.0 to 1.0)."""
-    if not COLORS_ENABLED:
-        return text
-    if prob >= 0.7:
-        return green(text)
-    elif prob >= 0.55:
-        return yellow(text)
-    else:
-        return dim(text)
+    return _PROB_PREFIXES[bisect.bisect_right(_PROB_THRESHOLDS, prob)] + text + _RESET
 
 
 def histogram_bar(bar: str, ratio: float) -> str:
     """Color histogram bar based on relative position."""
-    if not COLORS_ENABLED:
-        return bar
-    if ratio >= 0.9:
-        return _apply(Fg.BRIGHT_GREEN, bar)
-    elif ratio >= 0.7:
-        return _apply(Fg.GREEN, bar)
-    elif ratio >= 0.5:
-        return _apply(Fg.CYAN, bar)
-    elif ratio >= 0.3:
-        return _apply(Fg.BLUE, bar)
-    else:
-        return dim(bar)
+    return _HIST_PREFIXES[bisect.bisect_right(_HIST_THRESHOLDS, ratio)] + bar + _RESET
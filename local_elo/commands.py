@@ -3,8 +3,15 @@ import sys
 import os
 import argparse
 
-from .db import init_db, get_active_files, get_rankings
-from .elo import calculate_win_probability
+try:
+    # Line editing and history for input(); not available on Windows,
+    # where input() works without it
+    import readline
+except ImportError:
+    readline = None
+
+from .db import init_db, get_active_files_with_ranks
+from .elo import calculate_win_probability, result_deltas
 from .files import handle_open_command, handle_rename_command, handle_rem_command, sync_files
 from .ui import display_leaderboard, format_record, parse_top_command, display_welcome_message, format_matchup
 from .game import select_first_player, select_second_player
@@ -12,7 +19,46 @@ from .knockout import (
     handle_game_result, handle_reset_command, initialize_knockout_tournament, handle_winner_screen
 )
 from .colors import red, yellow, dim
-from .utils import display_name, extensions_to_pattern
+from .utils import display_name, extensions_to_pattern, list_filenames
+
+# Result commands, checked against every keystroke; frozensets give O(1)
+# membership without rebuilding a list per iteration
+KNOCKOUT_ONLY_RESULTS = frozenset({'A-', 'B-', 'A+', 'B+', 'TA-', 'TB-', 'T-'})
+ALL_RESULTS = frozenset({'A', 'B', 'T'}) | KNOCKOUT_ONLY_RESULTS
+
+_HISTORY_FILE = os.path.expanduser('~/.local_elo_history')
+
+
+def _setup_readline() -> None:
+    """Wire up command history and tab completion when readline is available."""
+    if readline is None:
+        return
+
+    readline.set_history_length(1000)
+    try:
+        readline.read_history_file(_HISTORY_FILE)
+    except OSError:
+        # No history yet (first run) or unreadable file - start fresh
+        pass
+
+    words = sorted({r.lower() for r in ALL_RESULTS} | {'o', 'top', 'ren', 'rem', 'reset'})
+
+    def completer(text: str, state: int):
+        matches = [w for w in words if w.startswith(text)]
+        return matches[state] if state < len(matches) else None
+
+    readline.set_completer(completer)
+    readline.parse_and_bind('tab: complete')
+
+
+def _save_history() -> None:
+    """Persist command history across sessions; best-effort."""
+    if readline is None:
+        return
+    try:
+        readline.write_history_file(_HISTORY_FILE)
+    except OSError:
+        pass
 
 
 def parse_pool_size(value: str):
@@ -113,6 +159,8 @@ def main():
     # Initialize database
     conn = init_db(args.target_dir)
 
+    _setup_readline()
+
     try:
         if args.knockout:
             eliminated, tournament_pool = initialize_knockout_tournament(
@@ -124,21 +172,51 @@ def main():
 
         display_welcome_message(args.knockout)
 
-        while True:
-            # Sync files with database
-            sync_files(conn, pattern, args.target_dir)
+        # In-memory cache of active files; re-read from disk/DB only when a
+        # command mutates paths or rows (rename/remove/reset) or the
+        # directory itself changes under us
+        files_dirty = True
+        dir_mtime = None
+        active_files = []
+        current_rankings = {}
+        all_elos = {}
 
-            # Get active files
-            files = get_active_files(conn, args.target_dir, pattern)
+        while True:
+            # One stat per turn catches files added, removed, or renamed
+            # outside the tool: the directory mtime bumps whenever its
+            # entries change
+            current_mtime = os.stat(args.target_dir).st_mtime_ns
+            if current_mtime != dir_mtime:
+                files_dirty = True
+
+            if files_dirty:
+                # Enumerate the directory once and share the listing below
+                existing = list_filenames(args.target_dir)
+
+                # Sync files with database; one transaction covers all the
+                # inserts and rolls back cleanly on Ctrl+C mid-sync
+                with conn:
+                    sync_files(conn, pattern, args.target_dir, existing)
+
+                # Get active files and rankings in one round trip
+                active_files, current_rankings, all_elos = get_active_files_with_ranks(
+                    conn, args.target_dir, pattern, existing
+                )
+                # O(1) row lookup by file id for in-place cache patches
+                id_to_index = {f.id: i for i, f in enumerate(active_files)}
+                files_dirty = False
+                dir_mtime = os.stat(args.target_dir).st_mtime_ns
 
             # In knockout mode, filter by tournament pool and eliminated players
             if args.knockout:
                 if tournament_pool:
                     # Only include files in the tournament pool
-                    files = [f for f in files if f[0] in tournament_pool and f[0] not in eliminated]
+                    files = [f for f in active_files if f.id in tournament_pool and f.id not in eliminated]
                 else:
                     # No pool restriction, just filter eliminated
-                    files = [f for f in files if f[0] not in eliminated]
+                    files = [f for f in active_files if f.id not in eliminated]
+            else:
+                files = active_files
 
             if len(files) == 0:
                 print(yellow("No files found matching the pattern."))
@@ -164,11 +242,9 @@ def main():
                 break
 
             # Display matchup
-            id_a, path_a, elo_a, _, _, _ = first_player
-            id_b, path_b, elo_b, _, _, _ = second_player
+            id_a, path_a, elo_a = first_player.id, first_player.path, first_player.elo
+            id_b, path_b, elo_b = second_player.id, second_player.path, second_player.elo
 
-            # Get current rankings
-            current_rankings = get_rankings(conn)
             rank_a = current_rankings.get(id_a, "?")
             rank_b = current_rankings.get(id_b, "?")
 
@@ -185,9 +261,14 @@ def main():
             display_path_a = display_name(path_a)
             display_path_b = display_name(path_b)
 
+            # Records, ranks, and probability are fixed for the turn; only
+            # the display paths can change (rename), so cache the rest
+            record_a = format_record(first_player)
+            record_b = format_record(second_player)
+
             matchup_display = format_matchup(
-                display_path_a, elo_a, rank_a, format_record(first_player),
-                display_path_b, elo_b, rank_b, format_record(second_player),
+                display_path_a, elo_a, rank_a, record_a,
+                display_path_b, elo_b, rank_b, record_b,
                 win_prob_display, prob_a
             )
             print(matchup_display)
@@ -199,6 +280,11 @@ def main():
                 else:
                     user_input = input("Your choice (A/B/t/o/top [N]/ren <old> <new>/rem a/b/ab): ").strip()
 
+                # Normalize once; the checks below reuse these instead of
+                # re-lowering/re-uppering the same string per branch
+                input_lower = user_input.lower()
+                input_upper = user_input.upper()
+
                 # Check for top command
                 top_n = parse_top_command(user_input)
                 if top_n is not None:
@@ -208,54 +294,73 @@ def main():
                     continue
 
                 # Check for open command
-                if user_input.lower() == 'o':
+                if input_lower == 'o':
                     handle_open_command(path_a, path_b, args.target_dir)
                     continue
 
                 # Check for rename command
-                if user_input.lower().startswith('ren '):
+                if input_lower.startswith('ren '):
                     path_a, path_b = handle_rename_command(conn, user_input, args.target_dir,
                                                            pattern, path_a, path_b)
+                    files_dirty = True
                     display_path_a = display_name(path_a)
                     display_path_b = display_name(path_b)
                     matchup_display = format_matchup(
-                        display_path_a, elo_a, rank_a, format_record(first_player),
-                        display_path_b, elo_b, rank_b, format_record(second_player),
+                        display_path_a, elo_a, rank_a, record_a,
+                        display_path_b, elo_b, rank_b, record_b,
                         win_prob_display, prob_a
                     )
                     print(matchup_display)
                     continue
 
                 # Check for reset command (knockout mode only)
-                if user_input.lower() == 'reset':
+                if input_lower == 'reset':
                     if handle_reset_command(conn, eliminated, tournament_pool):
                         # Break out of input loop to re-sync and start fresh
+                        files_dirty = True
                         break
                     else:
                         print(matchup_display)
                     continue
 
                 # Check for rem command
-                if user_input.lower().startswith('rem '):
+                if input_lower.startswith('rem '):
                     arg = user_input[4:].strip()
                     if handle_rem_command(conn, arg, id_a, id_b, path_a, path_b, args.target_dir, files, eliminated, tournament_pool):
+                        files_dirty = True
                         break
                     continue
 
                 # Check for knockout-only commands
-                if user_input.upper() in ['A-', 'B-', 'A+', 'B+', 'TA-', 'TB-', 'T-'] and not args.knockout:
+                if input_upper in KNOCKOUT_ONLY_RESULTS and not args.knockout:
                     print(red("Error: a-/b-/a+/b+/ta-/tb-/t- commands only available in knockout mode"))
                     continue
 
                 # Validate input
-                if user_input.upper() in ['A', 'B', 'T', 'A-', 'B-', 'A+', 'B+', 'TA-', 'TB-', 'T-']:
-                    result = user_input.upper()
+                if input_upper in ALL_RESULTS:
+                    result = input_upper
                     if result == 'T':
                         result = 'tie'
 
-                    handle_game_result(conn, result, id_a, id_b, elo_a, elo_b,
-                                     path_a, path_b, args.target_dir, args.knockout,
-                                     eliminated, pattern, tournament_pool)
+                    # handle_game_result patches all_elos and returns the
+                    # recomputed rankings, so no re-sort is needed here
+                    game_result, new_elo_a, new_elo_b, current_rankings = handle_game_result(
+                        conn, result, id_a, id_b, elo_a, elo_b,
+                        path_a, path_b, args.target_dir, args.knockout,
+                        eliminated, pattern, tournament_pool, current_rankings,
+                        files, all_elos)
+
+                    # Patch the in-memory cache instead of re-reading the DB
+                    deltas_a, deltas_b = result_deltas(game_result)
+                    for file_id, new_elo, deltas in ((id_a, new_elo_a, deltas_a),
+                                                     (id_b, new_elo_b, deltas_b)):
+                        index = id_to_index.get(file_id)
+                        if index is None:
+                            continue
+                        row = active_files[index]
+                        active_files[index] = row._replace(
+                            elo=new_elo, wins=row.wins + deltas[0],
+                            losses=row.losses + deltas[1], ties=row.ties + deltas[2])
                     break
                 else:
                     if args.knockout:
@@ -266,4 +371,11 @@ def main():
     except KeyboardInterrupt:
         print(dim("\n\nGoodbye!"))
     finally:
+        _save_history()
+        try:
+            # Let SQLite refresh its query-planner statistics while the
+            # session's access patterns are still on hand
+            conn.execute('PRAGMA optimize')
+        except sqlite3.Error:
+            pass
         conn.close()
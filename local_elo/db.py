@@ -3,17 +3,48 @@ import os
 import re
 import csv
 from datetime import datetime
-from typing import List, Tuple
+from typing import List, NamedTuple, Tuple
 
 from .constants import DEFAULT_ELO, DB_NAME
+from .utils import list_filenames, make_matcher
+
+
+class FileRow(NamedTuple):
+    """A files-table row. Tuple-compatible, so positional access still works."""
+    id: int
+    path: str
+    elo: float
+    wins: int
+    losses: int
+    ties: int
+
+# Per-turn SQL hoisted to constants so SQLite's statement cache always sees
+# identical query text, and conn.execute skips a fresh cursor allocation
+_SELECT_FILES_SQL = 'SELECT id, path, elo, wins, losses, ties FROM files'
+_SELECT_FILES_WITH_RANKS_SQL = (
+    'SELECT id, path, elo, wins, losses, ties, RANK() OVER (ORDER BY elo DESC) FROM files'
+)
+_SELECT_IDS_BY_ELO_SQL = 'SELECT id FROM files ORDER BY elo DESC'
 
 
 def init_db(target_dir: str = '.') -> sqlite3.Connection:
     """Initialize the SQLite database and create tables if they don't exist."""
     db_path = os.path.join(target_dir, DB_NAME)
-    conn = sqlite3.connect(db_path)
+    # A roomier prepared-statement cache keeps every query this tool runs
+    # compiled for the whole session (default is 128)
+    conn = sqlite3.connect(db_path, cached_statements=256)
     cursor = conn.cursor()
 
+    # WAL with relaxed sync keeps commits cheap for this single-writer CLI:
+    # each game's commit becomes a WAL append instead of a full journal fsync
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
+    cursor.execute('PRAGMA temp_store=MEMORY')
+    cursor.execute('PRAGMA cache_size=-8000')
+    # Serve reads through the page cache via mmap instead of read() calls;
+    # a no-op where the OS declines the mapping
+    cursor.execute('PRAGMA mmap_size=134217728')
+
     # Create files table
     cursor.execute('''
         CREATE TABLE IF NOT EXISTS files (
@@ -56,73 +87,74 @@ def init_db(target_dir: str = '.') -> sqlite3.Connection:
         )
     ''')
 
+    # Indexes matching the ORDER BY elo DESC queries let SQLite stream rows
+    # in index order instead of sorting on every turn; the leaderboard index
+    # covers its SELECT entirely
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_files_elo ON files(elo DESC, id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_files_leaderboard ON files(elo DESC, path, wins, losses, ties)')
+
+    # Lets entry removal delete a player's games without scanning the
+    # whole games table
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_games_file_a ON games(file_a_id)')
+    cursor.execute('CREATE INDEX IF NOT EXISTS idx_games_file_b ON games(file_b_id)')
+
     conn.commit()
     return conn
 
 
 def add_file_to_db(conn: sqlite3.Connection, filepath: str) -> None:
     """Add a new file to the database with default Elo rating."""
-    cursor = conn.cursor()
-    try:
-        cursor.execute(
-            'INSERT INTO files (path, elo) VALUES (?, ?)',
-            (filepath, DEFAULT_ELO)
-        )
-        conn.commit()
-    except sqlite3.IntegrityError:
-        # File already exists in database
-        pass
+    # INSERT OR IGNORE lets SQLite swallow duplicates without raising,
+    # avoiding Python exception unwinding on the common "already exists" path
+    conn.execute(
+        'INSERT OR IGNORE INTO files (path, elo) VALUES (?, ?)',
+        (filepath, DEFAULT_ELO)
+    )
+    conn.commit()
 
 
 def load_knockout_state(conn: sqlite3.Connection) -> set:
     """Load eliminated file IDs from database."""
-    cursor = conn.cursor()
-    cursor.execute('SELECT file_id FROM knockout_state')
-    eliminated_ids = {row[0] for row in cursor.fetchall()}
-    return eliminated_ids
-
-
-def save_elimination(conn: sqlite3.Connection, file_id: int) -> None:
-    """Mark a file as eliminated in the database."""
-    cursor = conn.cursor()
-    try:
-        cursor.execute(
-            'INSERT INTO knockout_state (file_id) VALUES (?)',
-            (file_id,)
+    # conn.execute reuses an internal cursor instead of allocating one
+    rows = conn.execute('SELECT file_id FROM knockout_state').fetchall()
+    return {row[0] for row in rows}
+
+
+def save_eliminations(conn: sqlite3.Connection, file_ids) -> None:
+    """Mark files as eliminated in the database in one batched transaction."""
+    # INSERT OR IGNORE swallows already-eliminated ids (shouldn't happen,
+    # but handle gracefully)
+    with conn:
+        conn.executemany(
+            'INSERT OR IGNORE INTO knockout_state (file_id) VALUES (?)',
+            [(file_id,) for file_id in file_ids]
         )
-        conn.commit()
-    except sqlite3.IntegrityError:
-        # File already eliminated (shouldn't happen, but handle gracefully)
-        pass
 
 
 def clear_knockout_state(conn: sqlite3.Connection) -> None:
     """Clear all knockout state from database."""
-    cursor = conn.cursor()
-    cursor.execute('DELETE FROM knockout_state')
+    conn.execute('DELETE FROM knockout_state')
     conn.commit()
 
 
 def save_knockout_pool(conn: sqlite3.Connection, file_ids: set) -> None:
-    """Save the tournament pool to database."""
-    cursor = conn.cursor()
-    for file_id in file_ids:
-        cursor.execute('INSERT OR IGNORE INTO knockout_pool (file_id) VALUES (?)', (file_id,))
-    conn.commit()
+    """Save the tournament pool to database in one batched transaction."""
+    with conn:
+        conn.executemany(
+            'INSERT OR IGNORE INTO knockout_pool (file_id) VALUES (?)',
+            [(file_id,) for file_id in file_ids]
+        )
 
 
 def load_knockout_pool(conn: sqlite3.Connection) -> set:
     """Load tournament pool file IDs from database."""
-    cursor = conn.cursor()
-    cursor.execute('SELECT file_id FROM knockout_pool')
-    pool_ids = {row[0] for row in cursor.fetchall()}
-    return pool_ids
+    rows = conn.execute('SELECT file_id FROM knockout_pool').fetchall()
+    return {row[0] for row in rows}
 
 
 def clear_knockout_pool(conn: sqlite3.Connection) -> None:
     """Clear the tournament pool table."""
-    cursor = conn.cursor()
-    cursor.execute('DELETE FROM knockout_pool')
+    conn.execute('DELETE FROM knockout_pool')
     conn.commit()
 
 
@@ -141,51 +173,80 @@ def remove_entry_from_database(conn: sqlite3.Connection, file_id: int) -> None:
     conn.commit()
 
 
-def get_knockout_stats(conn: sqlite3.Connection, target_dir: str = '.', pattern: str = '.*') -> dict:
-    """Get statistics about knockout state."""
-    cursor = conn.cursor()
+def get_active_files(conn: sqlite3.Connection, target_dir: str = '.', pattern: str = '.*',
+                     existing: set = None) -> List[FileRow]:
+    """
+    Get all files that still exist in the filesystem and match the pattern.
 
-    # Count eliminated players
-    cursor.execute('SELECT COUNT(*) FROM knockout_state')
-    eliminated_count = cursor.fetchone()[0]
+    An optional pre-built set of filenames (from list_filenames) can be passed
+    to avoid re-enumerating the directory.
+    """
+    all_files = conn.execute(_SELECT_FILES_SQL).fetchall()
 
-    # Get all active files (files that exist in database and on disk)
-    all_active_files = get_active_files(conn, target_dir, pattern)
+    match = make_matcher(pattern)
 
-    # Load eliminated IDs to filter them out
-    eliminated_ids = load_knockout_state(conn)
+    # One directory enumeration replaces a stat() syscall per row
+    if existing is None:
+        existing = list_filenames(target_dir)
 
-    # Count files still competing (active files minus eliminated)
-    competing_count = len([f for f in all_active_files if f[0] not in eliminated_ids])
+    # Filter to only files that still exist and match the pattern
+    active_files = [FileRow._make(f) for f in all_files if f[1] in existing and match(f[1])]
+    return active_files
 
-    # Total is all files that exist on disk
-    total_count = len(all_active_files)
 
-    return {
-        'eliminated_count': eliminated_count,
-        'competing_count': competing_count,
-        'total_count': total_count
-    }
+def get_active_files_with_ranks(conn: sqlite3.Connection, target_dir: str = '.', pattern: str = '.*',
+                                existing: set = None) -> Tuple[List[FileRow], dict, dict]:
+    """
+    Get active files and current rankings in a single query.
+
+    Uses RANK() OVER so the per-turn sync/select/rank sequence costs one
+    SELECT instead of separate active-files and rankings round trips.
+    Rankings cover every file in the database (matching get_rankings),
+    while the returned rows are filtered to files that exist on disk and
+    match the pattern.
+
+    Returns:
+        Tuple of (active_files, rankings, all_elos) where active_files is a
+        list of FileRow entries, rankings maps
+        file_id to rank position, and all_elos maps every file_id in the
+        database to its Elo (so callers can recompute rankings in memory).
+    """
+    all_files = conn.execute(_SELECT_FILES_WITH_RANKS_SQL).fetchall()
 
+    rankings = {row[0]: row[6] for row in all_files}
+    all_elos = {row[0]: row[2] for row in all_files}
 
-def get_active_files(conn: sqlite3.Connection, target_dir: str = '.', pattern: str = '.*') -> List[Tuple[int, str, float, int, int, int]]:
-    """Get all files that still exist in the filesystem and match the pattern."""
-    cursor = conn.cursor()
-    cursor.execute('SELECT id, path, elo, wins, losses, ties FROM files')
-    all_files = cursor.fetchall()
+    match = make_matcher(pattern)
 
-    regex = re.compile(pattern)
+    if existing is None:
+        existing = list_filenames(target_dir)
 
-    # Filter to only files that still exist and match the pattern
-    active_files = [f for f in all_files if os.path.exists(os.path.join(target_dir, f[1])) and regex.search(f[1])]
-    return active_files
+    active_files = [FileRow._make(f[:6]) for f in all_files if f[1] in existing and match(f[1])]
+    return active_files, rankings, all_elos
+
+
+def compute_rankings(elos: dict) -> dict:
+    """
+    Compute rankings from an in-memory {file_id: elo} mapping.
+
+    In-memory counterpart to the RANK() OVER query: equal Elos share a
+    rank, and the next distinct Elo skips the tied positions.
+    """
+    rankings = {}
+    prev_elo = None
+    rank = 0
+    for position, (file_id, elo) in enumerate(
+            sorted(elos.items(), key=lambda item: item[1], reverse=True), 1):
+        if elo != prev_elo:
+            rank = position
+            prev_elo = elo
+        rankings[file_id] = rank
+    return rankings
 
 
 def get_rankings(conn: sqlite3.Connection) -> dict:
     """Get current rankings as a dictionary mapping file_id to rank position."""
-    cursor = conn.cursor()
-    cursor.execute('SELECT id FROM files ORDER BY elo DESC')
-    results = cursor.fetchall()
+    results = conn.execute(_SELECT_IDS_BY_ELO_SQL).fetchall()
 
     rankings = {}
     for rank, (file_id,) in enumerate(results, 1):
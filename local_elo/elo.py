@@ -1,31 +1,79 @@
+import math
 import sqlite3
 from typing import Tuple
 
 from .constants import K_FACTOR, DEFAULT_ELO
 
+# 10 ** (x / 400) == exp(x * ln(10) / 400); folding the base conversion
+# into one constant swaps the generic pow for the cheaper math.exp
+_SCALE = math.log(10.0) / 400.0
+
 
 def calculate_win_probability(elo_a: float, elo_b: float) -> float:
     """Calculate the probability of player A beating player B using Elo formula."""
-    return 1.0 / (1.0 + 10.0 ** ((elo_b - elo_a) / 400.0))
+    return 1.0 / (1.0 + math.exp(_SCALE * (elo_b - elo_a)))
+
+
+# Precomputed probabilities over integer Elo differences. Selection weights
+# don't need sub-point precision, so the hot selector loops can replace the
+# 10 ** x call with a table lookup; rating updates keep the exact formula.
+_WIN_TABLE_RANGE = 2000
+_WIN_TABLE = [
+    1.0 / (1.0 + 10.0 ** (diff / 400.0))
+    for diff in range(-_WIN_TABLE_RANGE, _WIN_TABLE_RANGE + 1)
+]
+
+
+def win_probability_from_diff(diff: float) -> float:
+    """
+    Look up the probability of player A beating player B given the Elo
+    difference (elo_b - elo_a), rounded to the nearest point and clamped
+    to the table range.
+    """
+    index = int(diff) + _WIN_TABLE_RANGE
+    if index < 0:
+        index = 0
+    elif index > 2 * _WIN_TABLE_RANGE:
+        index = 2 * _WIN_TABLE_RANGE
+    return _WIN_TABLE[index]
+
+
+# Hot-path SQL hoisted to constants so SQLite's statement cache always
+# sees identical query text
+_UPDATE_FILES_SQL = 'UPDATE files SET elo = ?, wins = wins + ?, losses = losses + ?, ties = ties + ? WHERE id = ?'
+_INSERT_GAME_SQL = 'INSERT INTO games (file_a_id, file_b_id, result) VALUES (?, ?, ?)'
+
+
+# Actual scores per result, so the update kernel is pure arithmetic
+_ACTUAL_SCORES = {
+    'A': (1.0, 0.0),
+    'B': (0.0, 1.0),
+    'tie': (0.5, 0.5),
+}
+
+# (wins, losses, ties) increments for players A and B per result
+_RESULT_DELTAS = {
+    'A': ((1, 0, 0), (0, 1, 0)),
+    'B': ((0, 1, 0), (1, 0, 0)),
+    'tie': ((0, 0, 1), (0, 0, 1)),
+}
 
 
-def update_elo_ratings(conn: sqlite3.Connection, file_a_id: int, file_b_id: int,
-                       elo_a: float, elo_b: float, result: str) -> Tuple[float, float]:
+def result_deltas(result: str) -> Tuple[Tuple[int, int, int], Tuple[int, int, int]]:
+    """Return the (wins, losses, ties) increments for players A and B."""
+    return _RESULT_DELTAS[result]
+
+
+def update_elo_ratings(elo_a: float, elo_b: float, result: str) -> Tuple[float, float]:
     """
     Update Elo ratings based on the game result.
     Returns the new Elo ratings for both files.
     """
     # Calculate expected scores
-    expected_a = calculate_win_probability(elo_a, elo_b)
+    expected_a = 1.0 / (1.0 + math.exp(_SCALE * (elo_b - elo_a)))
     expected_b = 1.0 - expected_a
 
-    # Determine actual scores
-    if result == 'A':
-        actual_a, actual_b = 1.0, 0.0
-    elif result == 'B':
-        actual_a, actual_b = 0.0, 1.0
-    else:  # tie
-        actual_a, actual_b = 0.5, 0.5
+    actual_a, actual_b = _ACTUAL_SCORES.get(result, (0.5, 0.5))
 
     # Calculate new ratings
     new_elo_a = elo_a + K_FACTOR * (actual_a - expected_a)
@@ -66,28 +114,24 @@ def redistribute_elo_delta(conn: sqlite3.Connection, delta: float, skip_file_id:
 
 
 def record_game(conn: sqlite3.Connection, file_a_id: int, file_b_id: int,
-                elo_a: float, elo_b: float, result: str) -> None:
-    """Record a game and update Elo ratings."""
-    cursor = conn.cursor()
-
+                elo_a: float, elo_b: float, result: str) -> Tuple[float, float]:
+    """
+    Record a game and update Elo ratings.
+    Returns the new Elo ratings so callers can patch in-memory state
+    without re-reading the database.
+    """
     # Update Elo ratings
-    new_elo_a, new_elo_b = update_elo_ratings(conn, file_a_id, file_b_id, elo_a, elo_b, result)
-
-    # Update stats based on result
-    if result == 'A':
-        cursor.execute('UPDATE files SET elo = ?, wins = wins + 1 WHERE id = ?', (new_elo_a, file_a_id))
-        cursor.execute('UPDATE files SET elo = ?, losses = losses + 1 WHERE id = ?', (new_elo_b, file_b_id))
-    elif result == 'B':
-        cursor.execute('UPDATE files SET elo = ?, losses = losses + 1 WHERE id = ?', (new_elo_a, file_a_id))
-        cursor.execute('UPDATE files SET elo = ?, wins = wins + 1 WHERE id = ?', (new_elo_b, file_b_id))
-    else:  # tie
-        cursor.execute('UPDATE files SET elo = ?, ties = ties + 1 WHERE id = ?', (new_elo_a, file_a_id))
-        cursor.execute('UPDATE files SET elo = ?, ties = ties + 1 WHERE id = ?', (new_elo_b, file_b_id))
-
-    # Record the game
-    cursor.execute(
-        'INSERT INTO games (file_a_id, file_b_id, result) VALUES (?, ?, ?)',
-        (file_a_id, file_b_id, result)
-    )
+    new_elo_a, new_elo_b = update_elo_ratings(elo_a, elo_b, result)
 
-    conn.commit()
+    # Win/loss/tie deltas for both players based on the result
+    deltas_a, deltas_b = result_deltas(result)
+
+    # One batched UPDATE plus the game INSERT in a single transaction
+    with conn:
+        conn.executemany(
+            _UPDATE_FILES_SQL,
+            [(new_elo_a, *deltas_a, file_a_id), (new_elo_b, *deltas_b, file_b_id)]
+        )
+        conn.execute(_INSERT_GAME_SQL, (file_a_id, file_b_id, result))
+
+    return new_elo_a, new_elo_b
@@ -1,52 +1,76 @@
 import os
-import re
-import fnmatch
+from functools import lru_cache
 import datetime
 import sys
 import subprocess
 import sqlite3
 from typing import List, Tuple, Optional
 
-from .constants import DB_NAME
-from .db import add_file_to_db, remove_entry_from_database
+from .constants import DB_NAME, DEFAULT_ELO
+from .db import remove_entry_from_database
 from .elo import redistribute_elo_delta
 from .colors import green, red, yellow, cyan, bold, dim
+from .utils import list_filenames, make_matcher
 
+# Runs every turn; constant query text keeps SQLite's statement cache warm
+_INSERT_FILES_SQL = 'INSERT OR IGNORE INTO files (path, elo) VALUES (?, ?)'
+_UPDATE_PATH_SQL = 'UPDATE files SET path = ? WHERE path = ?'
 
-def discover_files(pattern: str, target_dir: str = '.') -> List[str]:
+# Names that never compete: the script itself, the database (including WAL
+# sidecars), and startup scripts. frozenset gives O(1) membership checks.
+_SKIP_NAMES = frozenset([
+    'local_elo.py', DB_NAME, f'{DB_NAME}-wal', f'{DB_NAME}-shm',
+    'elo_start.sh', 'elo_start.bat',
+])
+
+
+def discover_files(pattern: str, target_dir: str = '.', filenames: Optional[set] = None) -> List[str]:
     """
     Discover files in the target directory matching the regex pattern.
     Excludes the script itself, the database file, and hidden/system files.
+
+    An optional pre-built set of filenames (from list_filenames) can be passed
+    to avoid a second directory enumeration.
     """
     files = []
     print(dim(f"Discovering files in {target_dir} with pattern {pattern}"))
-    regex = re.compile(pattern)
 
-    for filename in os.listdir(target_dir):
-        # Skip directories
-        if os.path.isdir(os.path.join(target_dir, filename)):
-            continue
+    match = make_matcher(pattern)
 
+    if filenames is None:
+        filenames = list_filenames(target_dir)
+
+    for filename in filenames:
         # Skip hidden/system files (starting with .)
         if filename.startswith('.'):
             continue
 
-        # Skip the script itself, database, and startup scripts
-        if filename in ['local_elo.py', DB_NAME, 'elo_start.sh', 'elo_start.bat']:
+        if filename in _SKIP_NAMES:
             continue
 
         # Check if filename matches the pattern
-        if regex.search(filename):
+        if match(filename):
             files.append(filename)
 
     return files
 
 
-def sync_files(conn: sqlite3.Connection, pattern: str, target_dir: str = '.') -> None:
-    """Sync discovered files with the database."""
-    files = discover_files(pattern, target_dir)
-    for filepath in files:
-        add_file_to_db(conn, filepath)
+def sync_files(conn: sqlite3.Connection, pattern: str, target_dir: str = '.',
+               filenames: Optional[set] = None) -> None:
+    """
+    Sync discovered files with the database in a single batched insert.
+
+    Runs inside the caller's transaction (e.g. `with conn:`), which commits
+    on success and rolls back if the turn is interrupted.
+    """
+    files = discover_files(pattern, target_dir, filenames)
+
+    # Diff against the known paths first: on a typical refresh nothing is
+    # new, so we skip binding a row per file just for SQLite to ignore it
+    known = {row[0] for row in conn.execute('SELECT path FROM files')}
+    to_add = [(filepath, DEFAULT_ELO) for filepath in files if filepath not in known]
+    if to_add:
+        conn.executemany(_INSERT_FILES_SQL, to_add)
 
 
 def trash_file(filepath: str, target_dir: str) -> None:
@@ -94,12 +118,15 @@ def apply_wildcard_rename(old_pattern: str, new_pattern: str, target_dir: str) -
     
     matches = []
     old_prefix, old_suffix = old_pattern.split('*', 1)
-    
-    for filename in os.listdir(target_dir):
-        if os.path.isdir(os.path.join(target_dir, filename)):
-            continue
-        
-        if fnmatch.fnmatch(filename, old_pattern):
+    min_length = len(old_prefix) + len(old_suffix)
+
+    # With exactly one * the glob reduces to a prefix/suffix check, so
+    # there's no need to run fnmatch's regex per filename; list_filenames
+    # also replaces the per-entry isdir() stat with one scandir pass
+    for filename in sorted(list_filenames(target_dir)):
+        if (len(filename) >= min_length
+                and filename.startswith(old_prefix)
+                and filename.endswith(old_suffix)):
             matched_part = filename[len(old_prefix):len(filename) - len(old_suffix)]
             new_filename = new_pattern.replace('*', matched_part)
             matches.append((filename, new_filename))
@@ -151,6 +178,23 @@ def handle_rem_command(conn: sqlite3.Connection, arg: str, id_a: int, id_b: int,
     return True
 
 
+@lru_cache(maxsize=4)
+def _detect_startup_script(target_dir: str) -> Optional[str]:
+    """
+    Locate the per-directory startup script for this platform.
+
+    Cached so repeated 'o' commands skip the os.path.exists probe; the
+    script's presence is effectively fixed for a session.
+    """
+    if sys.platform in ['darwin', 'linux'] or sys.platform.startswith('linux'):
+        script_path = os.path.join(target_dir, 'elo_start.sh')
+    elif sys.platform == 'win32':
+        script_path = os.path.join(target_dir, 'elo_start.bat')
+    else:
+        return None
+    return script_path if os.path.exists(script_path) else None
+
+
 def handle_open_command(path_a: str, path_b: str, target_dir: str) -> None:
     """Handle the 'o' command to open both files."""
     full_path_a = os.path.join(target_dir, path_a)
@@ -159,37 +203,37 @@ def handle_open_command(path_a: str, path_b: str, target_dir: str) -> None:
     abs_path_a = os.path.abspath(full_path_a)
     abs_path_b = os.path.abspath(full_path_b)
 
-    custom_script = None
-    if sys.platform in ['darwin', 'linux'] or sys.platform.startswith('linux'):
-        script_path = os.path.join(target_dir, 'elo_start.sh')
-        if os.path.exists(script_path):
-            custom_script = script_path
-    elif sys.platform == 'win32':
-        script_path = os.path.join(target_dir, 'elo_start.bat')
-        if os.path.exists(script_path):
-            custom_script = script_path
+    custom_script = _detect_startup_script(target_dir)
 
     if custom_script:
-        if sys.platform in ['darwin', 'linux'] or sys.platform.startswith('linux'):
-            subprocess.run(['bash', custom_script, abs_path_a])
-            subprocess.run(['bash', custom_script, abs_path_b])
+        # Both paths go to one script invocation (scripts iterate "$@"),
+        # halving the interpreter spawns per 'o' command
+        if sys.platform == 'win32':
+            subprocess.run([custom_script, abs_path_a, abs_path_b])
         else:
-            subprocess.run([custom_script, abs_path_a])
-            subprocess.run([custom_script, abs_path_b])
+            subprocess.run(['bash', custom_script, abs_path_a, abs_path_b])
         print(f"Opened {cyan(path_a)} and {cyan(path_b)} using {os.path.basename(custom_script)}")
     else:
+        if sys.platform == 'win32':
+            # os.startfile hands off to the shell association directly,
+            # skipping the cmd.exe spawn 'start' would need
+            os.startfile(abs_path_a)
+            os.startfile(abs_path_b)
+            print(f"Opened {cyan(path_a)} and {cyan(path_b)}")
+            return
+
         if sys.platform == 'darwin':
-            open_cmd = 'open'
+            # macOS open takes several paths at once: one spawn, not two
+            subprocess.Popen(['open', abs_path_a, abs_path_b])
         elif sys.platform.startswith('linux'):
-            open_cmd = 'xdg-open'
-        elif sys.platform == 'win32':
-            open_cmd = 'start'
+            # xdg-open only accepts a single path; fire both off without
+            # waiting on the first viewer to exit
+            subprocess.Popen(['xdg-open', abs_path_a])
+            subprocess.Popen(['xdg-open', abs_path_b])
         else:
             print(yellow("Unsupported platform for opening files"))
             return
 
-        subprocess.run([open_cmd, abs_path_a])
-        subprocess.run([open_cmd, abs_path_b])
         print(f"Opened {cyan(path_a)} and {cyan(path_b)}")
 
 
@@ -222,17 +266,17 @@ def handle_rename_command(conn: sqlite3.Connection, user_input: str, target_dir:
             if conflict_found:
                 return path_a, path_b
             
-            cursor = conn.cursor()
-            renamed_count = 0
+            # Rename on disk first, then apply all path updates in a single
+            # transaction: one commit (and one fsync) instead of one per file
+            updates = []
             for old_filename, new_filename in matches:
                 old_path = os.path.join(target_dir, old_filename)
                 new_path = os.path.join(target_dir, new_filename)
-                
+
                 try:
                     os.rename(old_path, new_path)
-                    cursor.execute('UPDATE files SET path = ? WHERE path = ?', (new_filename, old_filename))
-                    renamed_count += 1
-                    
+                    updates.append((new_filename, old_filename))
+
                     if path_a == old_filename:
                         path_a = new_filename
                     if path_b == old_filename:
@@ -240,13 +284,15 @@ def handle_rename_command(conn: sqlite3.Connection, user_input: str, target_dir:
                 except OSError as e:
                     print(red(f"Error renaming '{old_filename}' to '{new_filename}': {e}"))
 
-            conn.commit()
-            print(green(f"Renamed {renamed_count} file(s)"))
+            with conn:
+                conn.executemany(_UPDATE_PATH_SQL, updates)
+            print(green(f"Renamed {len(updates)} file(s)"))
 
         except ValueError as e:
             print(red(f"Error: {e}"))
         
-        sync_files(conn, pattern, target_dir)
+        with conn:
+            sync_files(conn, pattern, target_dir)
         return path_a, path_b
     else:
         old_path = os.path.join(target_dir, old_name)
@@ -266,9 +312,8 @@ def handle_rename_command(conn: sqlite3.Connection, user_input: str, target_dir:
             print(red(f"Error renaming file: {e}"))
             return path_a, path_b
 
-        cursor = conn.cursor()
-        cursor.execute('UPDATE files SET path = ? WHERE path = ?', (new_name, old_name))
-        conn.commit()
+        with conn:
+            conn.execute(_UPDATE_PATH_SQL, (new_name, old_name))
 
         print(green(f"Renamed '{old_name}' to '{new_name}'"))
 
@@ -277,5 +322,6 @@ def handle_rename_command(conn: sqlite3.Connection, user_input: str, target_dir:
         if path_b == old_name:
             path_b = new_name
 
-        sync_files(conn, pattern, target_dir)
+        with conn:
+            sync_files(conn, pattern, target_dir)
         return path_a, path_b
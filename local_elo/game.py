@@ -1,12 +1,19 @@
+import bisect
 import random
-from typing import List, Tuple
+from itertools import accumulate
+from typing import List
 
 from .constants import DEFAULT_ELO
-from .elo import calculate_win_probability
+from .db import FileRow
+from .elo import win_probability_from_diff
 
 
-def select_first_player(files: List[Tuple[int, str, float, int, int, int]],
-                        power: float = 1.0) -> Tuple[int, str, float, int, int, int]:
+def _weighted_pick(files: List[FileRow], cumulative: List[float]) -> FileRow:
+    """Sample one row given its prebuilt cumulative weight vector."""
+    return files[bisect.bisect(cumulative, random.random() * cumulative[-1])]
+
+
+def select_first_player(files: List[FileRow], power: float = 1.0) -> FileRow:
     """
     Select the first player using weighted random selection.
     Combines two weights:
@@ -21,44 +28,39 @@ def select_first_player(files: List[Tuple[int, str, float, int, int, int]],
 
     Combined weight = elo_weight * games_weight
     """
-    weights = []
-    for f in files:
-        # Calculate Elo-based weight
-        elo_weight = calculate_win_probability(f[2], DEFAULT_ELO)
-
-        # Calculate games-played weight to balance play frequency
-        games_played = f[3] + f[4] + f[5]  # wins + losses + ties
-        games_weight = 1.0 / ((games_played + 1) ** power)
+    # Single pass: elo weight (chance of beating an average opponent) times
+    # games-played weight, accumulated straight into the cumulative
+    # distribution so sampling is one bisect instead of random.choices
+    # rebuilding the CDF internally
+    win_prob = win_probability_from_diff
+    cumulative = list(accumulate(
+        win_prob(DEFAULT_ELO - f.elo) / ((f.wins + f.losses + f.ties + 1) ** power)
+        for f in files
+    ))
 
-        # Combine weights multiplicatively
-        combined_weight = elo_weight * games_weight
-        weights.append(combined_weight)
+    return _weighted_pick(files, cumulative)
 
-    return random.choices(files, weights=weights, k=1)[0]
 
-
-def select_second_player(files: List[Tuple[int, str, float, int, int, int]],
-                        first_player: Tuple[int, str, float, int, int, int]) -> Tuple[int, str, float, int, int, int]:
+def select_second_player(files: List[FileRow], first_player: FileRow) -> FileRow:
     """
     Select the second player using weighted random selection.
     Weight = probability of weaker player beating stronger player (encourages close matches).
     """
-    # Remove first player from candidates
-    candidates = [f for f in files if f[0] != first_player[0]]
+    # Weight = probability of the weaker player beating the stronger one;
+    # the formula only depends on the absolute Elo gap, so no branching.
+    # Instead of copying the list to drop the first player, zero out their
+    # weight and sample directly via the cumulative distribution.
+    win_prob = win_probability_from_diff
+    first_id = first_player.id
+    first_elo = first_player.elo
+    cumulative = list(accumulate(
+        0.0 if f.id == first_id else win_prob(abs(first_elo - f.elo))
+        for f in files
+    ))
 
-    if not candidates:
+    total = cumulative[-1] if cumulative else 0.0
+    if total <= 0.0:
+        # No candidates besides the first player
         return None
 
-    # Calculate weights based on match closeness
-    weights = []
-    for candidate in candidates:
-        # Determine who is weaker/stronger
-        if first_player[2] > candidate[2]:
-            # First player is stronger
-            weight = calculate_win_probability(candidate[2], first_player[2])
-        else:
-            # Candidate is stronger
-            weight = calculate_win_probability(first_player[2], candidate[2])
-        weights.append(weight)
-
-    return random.choices(candidates, weights=weights, k=1)[0]
+    return _weighted_pick(files, cumulative)
@@ -23,9 +23,9 @@ class PoolConfig(NamedTuple):
         """Number of slots filled by custom weighted sampling (respects power param)."""
         return self.total_size - self.top_skewing_size
 from .db import (
-    load_knockout_state, save_elimination, clear_knockout_state,
-    get_knockout_stats, export_knockout_results, save_knockout_pool,
-    load_knockout_pool, clear_knockout_pool, get_active_files, get_rankings
+    load_knockout_state, save_eliminations, clear_knockout_state,
+    export_knockout_results, save_knockout_pool,
+    load_knockout_pool, clear_knockout_pool, get_active_files, compute_rankings
 )
 from .elo import calculate_win_probability, record_game
 from .ui import display_leaderboard, display_ranking_changes
@@ -36,82 +36,93 @@ from .utils import display_name
 def handle_game_result(conn: sqlite3.Connection, result: str, id_a: int, id_b: int,
                        elo_a: float, elo_b: float, path_a: str, path_b: str,
                        target_dir: str, knockout_mode: bool, eliminated: set,
-                       pattern: str, tournament_pool: set) -> None:
+                       pattern: str, tournament_pool: set,
+                       old_rankings: dict, files: list,
+                       all_elos: dict) -> Tuple[str, float, float, dict]:
     """
     Handle game result input (A, B, t, a-, b-, a+, b+, ta-, tb-, t-).
     Records the game, updates rankings, and handles knockout eliminations.
-    """
-    old_rankings = get_rankings(conn)
 
+    old_rankings is the pre-game rankings dict already fetched by the caller,
+    files is the caller's pool-filtered list of competitors for this matchup,
+    and all_elos is the caller's {file_id: elo} map covering the whole
+    database. The two changed Elos are patched into all_elos and rankings
+    are recomputed in memory, so the post-game display issues no queries.
+    Returns (game_result, new_elo_a, new_elo_b, new_rankings) so the caller
+    can patch its in-memory file cache.
+    """
     if result in ['A-', 'B-', 'A+', 'B+']:
         game_result = result.rstrip('-+')
     elif result in ['TA-', 'TB-', 'T-']:
         game_result = 'tie'
     else:
         game_result = result
-    record_game(conn, id_a, id_b, elo_a, elo_b, game_result)
+    new_elo_a, new_elo_b = record_game(conn, id_a, id_b, elo_a, elo_b, game_result)
+
+    all_elos[id_a] = new_elo_a
+    all_elos[id_b] = new_elo_b
+    new_rankings = compute_rankings(all_elos)
 
-    display_ranking_changes(conn, old_rankings, id_a, id_b, target_dir)
+    display_ranking_changes(old_rankings, new_rankings,
+                            [(id_a, path_a, new_elo_a), (id_b, path_b, new_elo_b)])
 
     if knockout_mode:
         remove_winner = result in ['A-', 'B-']
         keep_loser = result in ['A+', 'B+']
 
+        # Collect eliminations first and persist them in one batched write
+        # after the messages, so 'T-' costs a single commit instead of two
+        to_eliminate = []
+
         if result in ['A', 'A-', 'A+']:
             if remove_winner:
-                eliminated.add(id_a)
-                save_elimination(conn, id_a)
+                to_eliminate.append(id_a)
                 display_path = display_name(path_a)
                 print(f"  {bold_green(display_path)} wins but is {bold_red('REMOVED')} from tournament!\n")
             elif keep_loser:
                 display_path = display_name(path_a)
                 print(f"  {bold_green(display_path)} wins, but both players stay in tournament!\n")
             else:
-                eliminated.add(id_b)
-                save_elimination(conn, id_b)
+                to_eliminate.append(id_b)
                 display_path = display_name(path_a)
                 print(f"  {bold_green(display_path)} {bold_green('PROCEEDS')}!\n")
         elif result in ['B', 'B-', 'B+']:
             if remove_winner:
-                eliminated.add(id_b)
-                save_elimination(conn, id_b)
+                to_eliminate.append(id_b)
                 display_path = display_name(path_b)
                 print(f"  {bold_green(display_path)} wins but is {bold_red('REMOVED')} from tournament!\n")
             elif keep_loser:
                 display_path = display_name(path_b)
                 print(f"  {bold_green(display_path)} wins, but both players stay in tournament!\n")
             else:
-                eliminated.add(id_a)
-                save_elimination(conn, id_a)
+                to_eliminate.append(id_a)
                 display_path = display_name(path_b)
                 print(f"  {bold_green(display_path)} {bold_green('PROCEEDS')}!\n")
         elif result == 'TA-':
-            eliminated.add(id_a)
-            save_elimination(conn, id_a)
+            to_eliminate.append(id_a)
             display_path = display_name(path_a)
             print(f"  Tie, but {bold_red(display_path)} is {bold_red('REMOVED')} from tournament!\n")
         elif result == 'TB-':
-            eliminated.add(id_b)
-            save_elimination(conn, id_b)
+            to_eliminate.append(id_b)
             display_path = display_name(path_b)
             print(f"  Tie, but {bold_red(display_path)} is {bold_red('REMOVED')} from tournament!\n")
         elif result == 'T-':
-            eliminated.add(id_a)
-            eliminated.add(id_b)
-            save_elimination(conn, id_a)
-            save_elimination(conn, id_b)
+            to_eliminate.extend([id_a, id_b])
             print(f"  Tie, but {bold_red('BOTH')} players are {bold_red('REMOVED')} from tournament!\n")
         else:
             print(dim("  Tie - no one eliminated.\n"))
 
-        if tournament_pool:
-            remaining_count = len([f for f in get_active_files(conn, target_dir, pattern)
-                                  if f[0] in tournament_pool and f[0] not in eliminated])
-        else:
-            remaining_count = len([f for f in get_active_files(conn, target_dir, pattern)
-                                  if f[0] not in eliminated])
+        if to_eliminate:
+            eliminated.update(to_eliminate)
+            save_eliminations(conn, to_eliminate)
+
+        # files already excludes pool outsiders and earlier eliminations;
+        # just subtract whoever this result knocked out
+        remaining_count = sum(1 for f in files if f.id not in eliminated)
         print(f"Players remaining: {bold(str(remaining_count))}\n")
 
+    return game_result, new_elo_a, new_elo_b, new_rankings
+
 
 def handle_reset_command(conn: sqlite3.Connection, eliminated: set, tournament_pool: set) -> bool:
     """
@@ -154,13 +165,18 @@ def initialize_knockout_tournament(conn: sqlite3.Connection, target_dir: str, pa
                 print(red("Please use the same pool size or reset with --reset-knockout"))
                 sys.exit(1)
 
-        stats = get_knockout_stats(conn, target_dir, pattern)
-        competing_count = len(tournament_pool) - len(eliminated) if tournament_pool else stats['competing_count']
+        # One active-files fetch covers all three resume stats; eliminated
+        # and tournament_pool are already loaded above
+        active_files = get_active_files(conn, target_dir, pattern)
+        if tournament_pool:
+            competing_count = len(tournament_pool) - len(eliminated)
+        else:
+            competing_count = sum(1 for f in active_files if f.id not in eliminated)
         print(cyan("Resuming knockout tournament..."))
         if tournament_pool:
             print(f"  Tournament pool size: {bold(str(len(tournament_pool)))}")
-        print(f"  Total files in database: {bold(str(stats['total_count']))}")
-        print(f"  Already eliminated: {red(str(stats['eliminated_count']))}")
+        print(f"  Total files in database: {bold(str(len(active_files)))}")
+        print(f"  Already eliminated: {red(str(len(eliminated)))}")
         print(f"  Still competing: {green(str(competing_count))}")
         print()
     else:
@@ -177,8 +193,8 @@ def initialize_knockout_tournament(conn: sqlite3.Connection, target_dir: str, pa
             if pool_config.custom_weighted_size > 0:
                 pool_weights = []
                 for f in all_files:
-                    elo_weight = calculate_win_probability(f[2], DEFAULT_ELO)
-                    games_played = f[3] + f[4] + f[5]
+                    elo_weight = calculate_win_probability(f.elo, DEFAULT_ELO)
+                    games_played = f.wins + f.losses + f.ties
                     games_weight = 1.0 / ((games_played + 1) ** power)
                     pool_weights.append(elo_weight * games_weight)
 
@@ -191,7 +207,7 @@ def initialize_knockout_tournament(conn: sqlite3.Connection, target_dir: str, pa
                     chosen = random.choices(remaining_files, weights=remaining_weights, k=1)[0]
                     idx = remaining_files.index(chosen)
                     custom_weighted_selected.append(chosen)
-                    selected_ids.add(chosen[0])
+                    selected_ids.add(chosen.id)
                     remaining_files.pop(idx)
                     remaining_weights.pop(idx)
 
@@ -201,10 +217,10 @@ def initialize_knockout_tournament(conn: sqlite3.Connection, target_dir: str, pa
             # Phase 2: Top-skewing weighted-select Y candidates from remaining pool
             if pool_config.top_skewing_size > 0:
                 # Get candidates not already selected
-                remaining_candidates = [f for f in all_files if f[0] not in selected_ids]
+                remaining_candidates = [f for f in all_files if f.id not in selected_ids]
 
                 # Sort by Elo (highest first) to get position-based ranking
-                sorted_candidates = sorted(remaining_candidates, key=lambda f: f[2], reverse=True)
+                sorted_candidates = sorted(remaining_candidates, key=lambda f: f.elo, reverse=True)
                 total_remaining = len(sorted_candidates)
 
                 # Calculate weights based on position (top positions get higher weights)
@@ -231,7 +247,7 @@ def initialize_knockout_tournament(conn: sqlite3.Connection, target_dir: str, pa
                 selected_files.extend(top_skewing_selected)
                 print(cyan(f"Selected {pool_config.top_skewing_size} candidates via top-skewing weighted sampling"))
 
-            tournament_pool = {f[0] for f in selected_files}
+            tournament_pool = {f.id for f in selected_files}
             save_knockout_pool(conn, tournament_pool)
 
             # Summary message
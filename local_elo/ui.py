@@ -1,15 +1,14 @@
 import sqlite3
 import os
-import re
 from typing import Tuple, Optional
 
 from .constants import DEFAULT_LEADERBOARD_SIZE
-from .db import get_rankings, get_knockout_results
+from .db import get_knockout_results
 from .colors import (
     green, red, yellow, cyan, dim, bold, bold_cyan, bold_red,
     prob_color, histogram_bar
 )
-from .utils import display_name
+from .utils import display_name, make_matcher
 
 
 def format_record_values(wins: int, losses: int, ties: int) -> str:
@@ -42,17 +41,17 @@ def create_elo_histogram(elo: float, max_elo: float, bar_width: int = 80) -> str
     return colored_bar + ' ' * (bar_width - filled_blocks)
 
 
-def format_record(player: tuple) -> str:
+def format_record(player) -> str:
     """
-    Format a W/T/L record string from a player tuple.
+    Format a W/T/L record string from a FileRow.
 
     Args:
-        player: Tuple in format (id, path, elo, wins, losses, ties)
+        player: FileRow (id, path, elo, wins, losses, ties)
 
     Returns:
         Formatted string like "12W-8L-2T"
     """
-    return format_record_values(player[3], player[4], player[5])
+    return format_record_values(player.wins, player.losses, player.ties)
 
 
 def display_leaderboard(
@@ -82,10 +81,10 @@ def display_leaderboard(
         # Filter results if needed
         if not show_all_files:
             # Filter to files that exist on disk and match pattern
-            regex = re.compile(pattern)
+            match = make_matcher(pattern)
             results = [
                 r for r in all_results
-                if os.path.exists(os.path.join(target_dir, r[0])) and regex.search(r[0])
+                if os.path.exists(os.path.join(target_dir, r[0])) and match(r[0])
             ]
         else:
             results = all_results
@@ -100,7 +99,9 @@ def display_leaderboard(
         # Find max Elo for scaling (use first entry which is the winner)
         max_elo = results[0][1] if results else 1000
 
-        print(f"\n{bold_cyan('Knockout Tournament Results:')}")
+        # Build the whole board and write it in one go rather than
+        # locking/flushing stdout per row
+        lines = [f"\n{bold_cyan('Knockout Tournament Results:')}"]
         for i, (path, elo, wins, losses, ties, eliminated_at) in enumerate(results, 1):
             display_path = display_name(path)
 
@@ -110,14 +111,16 @@ def display_leaderboard(
             # Format record string
             record = format_record_values(wins, losses, ties)
 
-            # Print: histogram | rank | elo | record | path
-            print(f"{histogram} {i:2d}. {int(elo):4d} ({record:12s}) {display_path}")
-        print()
+            # Row: histogram | rank | elo | record | path
+            lines.append(f"{histogram} {i:2d}. {int(elo):4d} ({record:12s}) {display_path}")
+        lines.append('')
+        print('\n'.join(lines))
     else:
-        # Original elo-based sorting
+        # Original elo-based sorting; quantize elo for display in the query
+        # so each row formats an integer directly
         cursor = conn.cursor()
         cursor.execute(
-            'SELECT path, elo, wins, losses, ties FROM files ORDER BY elo DESC LIMIT ?',
+            'SELECT path, CAST(elo AS INTEGER), wins, losses, ties FROM files ORDER BY elo DESC LIMIT ?',
             (limit,)
         )
         results = cursor.fetchall()
@@ -144,7 +147,7 @@ def display_leaderboard(
                         elim_row = cursor_pool.fetchone()
                         elimination_status[path] = elim_row[0] if elim_row else None
 
-        print(f"\n{bold_cyan(f'Top {limit} Files:')}")
+        lines = [f"\n{bold_cyan(f'Top {limit} Files:')}"]
         for i, (path, elo, wins, losses, ties) in enumerate(results, 1):
             display_path = display_name(path)
 
@@ -164,33 +167,23 @@ def display_leaderboard(
                 else:
                     pool_marker = f" {yellow('●')}"
 
-            # Print: histogram | rank | elo | record | path
-            print(f"{histogram} {i:2d}. {int(elo):4d} ({record:12s}){pool_marker} {display_path}")
-        print()
+            # Row: histogram | rank | elo | record | path
+            lines.append(f"{histogram} {i:2d}. {elo:4d} ({record:12s}){pool_marker} {display_path}")
+        lines.append('')
+        print('\n'.join(lines))
 
 
-def display_ranking_changes(conn: sqlite3.Connection, old_rankings: dict,
-                           file_a_id: int, file_b_id: int, target_dir: str = '.') -> None:
-    """Display ranking changes for the two files that just competed."""
-    cursor = conn.cursor()
-
-    # Get new rankings
-    new_rankings = get_rankings(conn)
-
-    # Get file info for both players with new Elo ratings
-    cursor.execute('SELECT id, path, elo FROM files WHERE id IN (?, ?)', (file_a_id, file_b_id))
-    files = cursor.fetchall()
-
-    # Create a dict for easy lookup
-    files_dict = {file_id: (path, new_elo) for file_id, path, new_elo in files}
+def display_ranking_changes(old_rankings: dict, new_rankings: dict,
+                            players: list) -> None:
+    """
+    Display ranking changes for the two files that just competed.
 
-    print(f"\n{bold('Rankings:')}")
+    Both ranking dicts and the (file_id, path, new_elo) player entries come
+    from the caller's in-memory state, so this is pure formatting — no SQL.
+    """
+    lines = [f"\n{bold('Rankings:')}"]
     # Display in order: A first, then B
-    for file_id in [file_a_id, file_b_id]:
-        if file_id not in files_dict:
-            continue
-
-        path, new_elo = files_dict[file_id]
+    for file_id, path, new_elo in players:
         old_rank = old_rankings.get(file_id, "N/A")
         new_rank = new_rankings.get(file_id, "N/A")
 
@@ -206,22 +199,32 @@ def display_ranking_changes(conn: sqlite3.Connection, old_rankings: dict,
             movement = red(f"#{new_rank} (down from #{old_rank})")
 
         display_path = display_name(path)
-        print(f"  {cyan(display_path)}: {movement} | New Elo: {bold(str(int(new_elo)))}")
-    print()
+        lines.append(f"  {cyan(display_path)}: {movement} | New Elo: {bold(str(int(new_elo)))}")
+    lines.append('')
+    print('\n'.join(lines))
 
 
 def parse_top_command(user_input: str) -> Optional[int]:
     """Parse 'top N' command and return the number, or None if not a top command."""
-    parts = user_input.strip().lower().split()
-    if not parts or parts[0] != 'top':
+    stripped = user_input.strip()
+
+    # Cheap prefix check: most inputs are single-letter results, so bail
+    # without lowercasing or splitting the whole string
+    if len(stripped) < 3 or stripped[:3].lower() != 'top':
+        return None
+
+    rest = stripped[3:]
+    if rest and not rest[0].isspace():
+        # Something like 'topx' - not a top command
         return None
 
-    if len(parts) == 1:
+    rest = rest.strip()
+    if not rest:
         return DEFAULT_LEADERBOARD_SIZE
 
     try:
-        return int(parts[1])
-    except (ValueError, IndexError):
+        return int(rest.split(None, 1)[0])
+    except ValueError:
         return DEFAULT_LEADERBOARD_SIZE
 
 
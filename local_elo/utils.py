@@ -2,11 +2,62 @@
 
 import os
 import re
+from functools import lru_cache
 
 # Global configuration for link pattern
 LINK_PATTERN = None
 
 
+@lru_cache(maxsize=8)
+def _compiled(pattern: str) -> re.Pattern:
+    """Compile a pattern once per session; matching runs every turn."""
+    return re.compile(pattern)
+
+
+# Shape of the patterns produced by extensions_to_pattern:
+# '.*\.py$' or '.*\.(py|js)$' (extensions are plain word characters)
+_SUFFIX_PATTERN = re.compile(r'^\.\*\\\.(?:(\w+)|\((\w+(?:\|\w+)*)\))\$$')
+
+
+@lru_cache(maxsize=8)
+def make_matcher(pattern: str):
+    """
+    Return a filename -> bool callable specialized for the pattern.
+
+    The default '.*' matches everything, and the extension patterns built
+    by extensions_to_pattern reduce to a str.endswith check, which beats
+    running the regex engine per filename. Anything else falls back to a
+    cached compiled regex.
+    """
+    if pattern == '.*':
+        return lambda _: True
+
+    suffix_match = _SUFFIX_PATTERN.match(pattern)
+    if suffix_match:
+        extensions = suffix_match.group(1) or suffix_match.group(2)
+        suffixes = tuple(f'.{ext}' for ext in extensions.split('|'))
+        return lambda filename: filename.endswith(suffixes)
+
+    return _compiled(pattern).search
+
+
+def list_filenames(target_dir: str = '.') -> set:
+    """
+    List non-directory entry names in a directory as a set.
+
+    Uses a single os.scandir pass so callers can do O(1) membership
+    checks instead of one stat() syscall per file.
+
+    Args:
+        target_dir: Directory to enumerate
+
+    Returns:
+        Set of filenames (not full paths) for all non-directory entries
+    """
+    with os.scandir(target_dir) as entries:
+        return {e.name for e in entries if not e.is_dir()}
+
+
 def _format_hyperlink(text: str, url: str, enabled: bool = True) -> str:
     """
     Format text as a terminal hyperlink using OSC 8 escape sequences.
@@ -65,10 +116,15 @@ def _build_link_url(filename: str, pattern: str) -> str:
     return url
 
 
+@lru_cache(maxsize=4096)
 def get_filename(filepath: str) -> str:
     """
     Extract just the base filename without directory or extension.
 
+    Memoized: the same paths are formatted on every matchup and
+    leaderboard line, and the result depends only on the string itself
+    (a renamed file is a new key, so entries never go stale).
+
     Args:
         filepath: Path to file (may include directory)
 